@@ -16,7 +16,8 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import glob
+import collections
+import concurrent.futures
 import io
 import json
 import logging
@@ -33,14 +34,26 @@ import pyaudio
 
 import gi
 gi.require_version("Gtk", "3.0")
-from gi.repository import Gtk, GObject, Gdk, GdkPixbuf, GLib
+from gi.repository import Gtk, GdkPixbuf, GLib
+
+try:
+    import orjson  # considerably faster than the stdlib, but optional
+except ImportError:
+    orjson = None
 
 import nrsc5
 
+# compiled once at import; these run on every received map file or info packet
+TRAFFIC_FILE_RE = re.compile(r"^TMT_.*_([1-3])_([1-3])_(\d{8}_\d{4}).*$")
+WEATHER_OVERLAY_RE = re.compile(r"^DWRO_(.*)_.*_(\d{8}_\d{4}).*$")
+COORDINATES_RE = re.compile(r"^Coordinates=.*\((.*),(.*)\).*\((.*),(.*)\).*$")
+WEATHER_MAP_RE = re.compile("^weather_map_([a-zA-Z0-9]+)_([0-9]+).png$")
+
 
 class NRSC5GUI(object):
     AUDIO_SAMPLE_RATE = 44100
     AUDIO_SAMPLES_PER_FRAME = 2048
+    AUDIO_PREBUFFER_FRAMES = 8  # ~0.4 s buffered before playback (re)starts
     MAP_FILE = "map.png"
     VERSION = "2.0.0"
 
@@ -51,14 +64,36 @@ class NRSC5GUI(object):
                             format="%(asctime)s %(levelname)-5s %(filename)s:%(lineno)d: %(message)s",
                             datefmt="%H:%M:%S")
 
-        GObject.threads_init()
-
         self.get_controls()  # get controls and windows
+
         self.init_stream_info()  # initilize stream info and clear status widgets
 
         self.radio = None
-        self.audio_queue = queue.Queue(maxsize=64)
+        # one dict probe replaces the long elif chain for every radio event;
+        # LOST_DEVICE and LOST_SYNC have no handlers yet (TODO: update the GUI?)
+        self.event_handlers = {
+            nrsc5.EventType.SYNC: self.handle_sync,
+            nrsc5.EventType.MER: self.handle_mer,
+            nrsc5.EventType.BER: self.handle_ber,
+            nrsc5.EventType.HDC: self.handle_hdc,
+            nrsc5.EventType.AUDIO: self.handle_audio,
+            nrsc5.EventType.ID3: self.handle_id3,
+            nrsc5.EventType.SIG: self.handle_sig,
+            nrsc5.EventType.LOT: self.handle_lot,
+            nrsc5.EventType.SIS: self.handle_sis,
+        }
+        self.bitrate_scale = 8 * self.AUDIO_SAMPLE_RATE / self.AUDIO_SAMPLES_PER_FRAME / 1000
+        # single producer (radio callback) / single consumer (audio_worker);
+        # deque appends and pops are atomic under the GIL, so the radio thread
+        # never takes a lock, and a full buffer drops the oldest frame instead
+        # of blocking the callback
+        self.audio_buffer = collections.deque(maxlen=64)
+        self.audio_event = threading.Event()
         self.audio_thread = threading.Thread(target=self.audio_worker)
+        self.file_writer_queue = queue.Queue()
+        self.file_writer_thread = threading.Thread(target=self.file_writer_worker)
+        # map decoding & compositing runs here so the radio callback never blocks on it
+        self.map_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
         self.playing = False
         self.status_timer = None
         self.image_changed = False
@@ -68,12 +103,24 @@ class NRSC5GUI(object):
         self.station_str = ""  # current station frequency (string)
         self.stream_num = 0
         self.bookmarks = []
+        self.bookmark_by_freq = {}  # bookmarks indexed by packed station number
         self.station_logos = {}
+        self.station_logos_dirty = False
+        self.pixbuf_cache = {}  # scaled 200x200 pixbufs keyed by file path
         self.bookmarked = False
         self.map_viewer = None
+        self.viewer_notify_id = None  # pending debounced viewer refresh
+        self.base_map_img = None  # decoded RGBA base map for the current station
+        self.weather_scratch = None  # reusable composite buffer for weather maps
+        self.timestamp_font = None  # loaded on first use
+        self.timestamp_template = None  # background tile with the border pre-drawn
+        self.timestamp_text = None  # last rendered timestamp string
+        self.timestamp_img = None  # rendered tile for timestamp_text
         self.weather_maps = []  # list of current weathermaps sorted by time
+        self.last_map_prune = 0  # when expired weather maps were last purged
         self.traffic_map = Image.new("RGB", (600, 600), "white")
         self.map_tiles = [[0, 0, 0], [0, 0, 0], [0, 0, 0]]
+        self.tile_hashes = [[None, None, None] for _ in range(3)]  # payload hash per tile
         self.map_data = {
             "map_mode": 1,
             "weather_time": 0,
@@ -110,6 +157,25 @@ class NRSC5GUI(object):
         self.process_weather_maps()
 
         self.audio_thread.start()
+        self.file_writer_thread.start()
+
+    PIXBUF_CACHE_SIZE = 32
+
+    def load_scaled_pixbuf(self, path):
+        """load an image as a 200x200 pixbuf, reusing already decoded ones"""
+        mtime = os.path.getmtime(path)
+        cached = self.pixbuf_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        # scaling during decode lets the image loader skip pixels that would
+        # be thrown away, instead of decoding full size and resampling
+        pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(path, 200, 200, False)
+        if len(self.pixbuf_cache) >= self.PIXBUF_CACHE_SIZE:
+            # drop the oldest entry to keep memory use bounded
+            self.pixbuf_cache.pop(next(iter(self.pixbuf_cache)))
+        self.pixbuf_cache[path] = (mtime, pixbuf)
+        return pixbuf
 
     def display_logo(self):
         if self.station_str in self.station_logos:
@@ -117,12 +183,11 @@ class NRSC5GUI(object):
             logo = os.path.join(self.aas_dir, self.station_logos[self.station_str][self.stream_num])
             if os.path.isfile(logo):
                 self.stream_info["logo"] = self.station_logos[self.station_str][self.stream_num]
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file(logo)
-                pixbuf = pixbuf.scale_simple(200, 200, GdkPixbuf.InterpType.HYPER)
-                self.img_cover.set_from_pixbuf(pixbuf)
+                self.img_cover.set_from_pixbuf(self.load_scaled_pixbuf(logo))
         else:
             # add entry in database for the station if it doesn't exist
             self.station_logos[self.station_str] = ["", "", "", ""]
+            self.station_logos_dirty = True
 
     def on_btn_play_clicked(self, _btn):
         """start playback"""
@@ -135,9 +200,8 @@ class NRSC5GUI(object):
             self.spin_ppm.update()
             self.spin_rtl.update()
 
-            # start the timer
-            self.status_timer = threading.Timer(1, self.check_status)
-            self.status_timer.start()
+            # start the status update timer on the main loop
+            self.status_timer = GLib.timeout_add_seconds(1, self.check_status)
 
             # disable the controls
             self.spin_freq.set_sensitive(False)
@@ -158,12 +222,7 @@ class NRSC5GUI(object):
             self.display_logo()
 
             # check if station is bookmarked
-            self.bookmarked = False
-            freq = int((self.spin_freq.get_value()+0.005)*100) + int(self.spin_stream.get_value())
-            for bookmark in self.bookmarks:
-                if bookmark[2] == freq:
-                    self.bookmarked = True
-                    break
+            self.bookmarked = self.packed_station() in self.bookmark_by_freq
 
             self.btn_bookmark.set_sensitive(not self.bookmarked)
             if self.notebook_main.get_current_page() != 3:
@@ -181,7 +240,7 @@ class NRSC5GUI(object):
                 self.radio = None
 
             # stop timer
-            self.status_timer.cancel()
+            GLib.source_remove(self.status_timer)
             self.status_timer = None
 
             # enable controls
@@ -203,8 +262,7 @@ class NRSC5GUI(object):
                 self.btn_delete.set_sensitive(False)
 
     def on_btn_bookmark_clicked(self, _btn):
-        # pack frequency and channel number into one int
-        freq = int((self.spin_freq.get_value()+0.005)*100) + int(self.spin_stream.get_value())
+        freq = self.packed_station()
 
         # create bookmark
         bookmark = [
@@ -214,6 +272,7 @@ class NRSC5GUI(object):
         ]
         self.bookmarked = True
         self.bookmarks.append(bookmark)
+        self.bookmark_by_freq[freq] = bookmark
         self.ls_bookmarks.append(bookmark)
         self.btn_bookmark.set_sensitive(False)
 
@@ -223,7 +282,7 @@ class NRSC5GUI(object):
     def on_btn_delete_clicked(self, _btn):
         # select current station if not on bookmarks page
         if self.notebook_main.get_current_page() != 3:
-            station = int((self.spin_freq.get_value()+0.005)*100) + int(self.spin_stream.get_value())
+            station = self.packed_station()
             for i in range(len(self.ls_bookmarks)):
                 if self.ls_bookmarks[i][2] == station:
                     self.lv_bookmarks.set_cursor(i)
@@ -237,15 +296,20 @@ class NRSC5GUI(object):
         model.remove(tree_iter)
 
         # remove bookmark
-        for i in range(len(self.bookmarks)):
-            if self.bookmarks[i][2] == station:
-                self.bookmarks.pop(i)
-                break
+        bookmark = self.bookmark_by_freq.pop(station, None)
+        if bookmark is not None:
+            self.bookmarks.remove(bookmark)
 
         if self.notebook_main.get_current_page() != 3 and self.playing:
             self.btn_bookmark.set_sensitive(True)
             self.bookmarked = False
 
+    def packed_station(self):
+        """pack the current frequency and stream number into one int"""
+        # the tuner steps in tenths of a MHz, so rounding to one decimal is
+        # exact and avoids the old hand-tuned epsilon
+        return round(self.spin_freq.get_value() * 10) * 10 + int(self.spin_stream.get_value())
+
     def on_btn_about_activate(self, _btn):
         """sets up and displays about dialog"""
         if self.about_dialog:
@@ -345,10 +409,9 @@ class NRSC5GUI(object):
         self.ls_bookmarks.set(tree_iter, 1, text)
 
         # update name in bookmarks array
-        for bookmark in self.bookmarks:
-            if bookmark[2] == self.ls_bookmarks[path][2]:
-                bookmark[1] = text
-                break
+        bookmark = self.bookmark_by_freq.get(self.ls_bookmarks[path][2])
+        if bookmark is not None:
+            bookmark[1] = text
 
     def on_notebook_main_switch_page(self, _notebook, _page, page_num):
         # disable delete button if not on bookmarks page and station is not bookmarked
@@ -366,20 +429,23 @@ class NRSC5GUI(object):
         if btn.get_active():
             if btn == self.rad_map_traffic:
                 self.map_data["map_mode"] = 0
-                map_file = os.path.join("map", "traffic_map.png")
-                if os.path.isfile(map_file):
-                    map_img = Image.open(map_file).resize((200, 200), Image.LANCZOS)
-                    self.img_map.set_from_pixbuf(img_to_pixbuf(map_img))
-                else:
-                    self.img_map.set_from_stock(Gtk.STOCK_MISSING_IMAGE, Gtk.IconSize.LARGE_TOOLBAR)
+                self.display_map_preview(os.path.join("map", "traffic_map.png"))
 
             elif btn == self.rad_map_weather:
                 self.map_data["map_mode"] = 1
-                if os.path.isfile(self.map_data["weather_now"]):
-                    map_img = Image.open(self.map_data["weather_now"]).resize((200, 200), Image.LANCZOS)
-                    self.img_map.set_from_pixbuf(img_to_pixbuf(map_img))
-                else:
-                    self.img_map.set_from_stock(Gtk.STOCK_MISSING_IMAGE, Gtk.IconSize.LARGE_TOOLBAR)
+                self.display_map_preview(self.map_data["weather_now"])
+
+    def display_map_preview(self, map_file):
+        """show the 200x200 preview of a map on the map page"""
+        thumb_file = self.thumbnail_path(map_file)
+        if os.path.isfile(thumb_file):
+            # the pre-rendered thumbnail skips decoding the full size map
+            self.img_map.set_from_pixbuf(GdkPixbuf.Pixbuf.new_from_file(thumb_file))
+        elif os.path.isfile(map_file):
+            map_img = Image.open(map_file).resize((200, 200), Image.BILINEAR)
+            self.img_map.set_from_pixbuf(img_to_pixbuf(map_img))
+        else:
+            self.img_map.set_from_stock(Gtk.STOCK_MISSING_IMAGE, Gtk.IconSize.LARGE_TOOLBAR)
 
     def on_btn_map_clicked(self, _btn):
         """open map viewer window"""
@@ -391,6 +457,19 @@ class NRSC5GUI(object):
         """delete the map viewer"""
         self.map_viewer = None
 
+    def notify_viewer(self):
+        """refresh the map viewer 250 ms after the last map change so a
+        burst of arriving tiles collapses into a single repaint"""
+        if self.viewer_notify_id is not None:
+            GLib.source_remove(self.viewer_notify_id)
+        self.viewer_notify_id = GLib.timeout_add(250, self.viewer_notify_expired)
+
+    def viewer_notify_expired(self):
+        self.viewer_notify_id = None
+        if self.map_viewer is not None:
+            self.map_viewer.updated()
+        return False
+
     def play(self):
         self.radio = nrsc5.NRSC5(lambda type, evt: self.callback(type, evt))
         self.radio.open(int(self.spin_rtl.get_value()))
@@ -405,68 +484,87 @@ class NRSC5GUI(object):
         self.radio.set_frequency(self.spin_freq.get_value() * 1e6)
         self.radio.start()
 
+    def update_widget(self, setter, key, text):
+        """update a text widget only when its value actually changed"""
+        if self.label_cache.get(key) != text:
+            setter(text)
+            self.label_cache[key] = text
+
     def check_status(self):
-        """update status information"""
-        def update():
-            Gdk.threads_enter()
-            try:
-                image_path = ""
-                image = ""
-                ber = [self.stream_info["ber"][i]*100 for i in range(4)]
-                self.txt_title.set_text(self.stream_info["title"])
-                self.txt_artist.set_text(self.stream_info["artist"])
-                self.txt_album.set_text(self.stream_info["album"])
-                self.lbl_bitrate.set_label("{:3.1f} kbps".format(self.stream_info["bitrate"]))
-                self.lbl_bitrate2.set_label("{:3.1f} kbps".format(self.stream_info["bitrate"]))
-                self.lbl_error.set_label("{:2.2f}% Error ".format(ber[1]))
-                self.lbl_callsign.set_label(" " + self.stream_info["callsign"])
-                self.lbl_name.set_label(self.stream_info["callsign"])
-                self.lbl_slogan.set_label(self.stream_info["slogan"])
-                self.lbl_slogan.set_tooltip_text(self.stream_info["slogan"])
-                self.lbl_mer_lower.set_label("{:1.2f} dB".format(self.stream_info["mer"][0]))
-                self.lbl_mer_upper.set_label("{:1.2f} dB".format(self.stream_info["mer"][1]))
-                self.lbl_ber_now.set_label("{:1.3f}% (Now)".format(ber[0]))
-                self.lbl_ber_avg.set_label("{:1.3f}% (Avg)".format(ber[1]))
-                self.lbl_ber_min.set_label("{:1.3f}% (Min)".format(ber[2]))
-                self.lbl_ber_max.set_label("{:1.3f}% (Max)".format(ber[3]))
-
-                if self.cb_auto_gain.get_active():
-                    self.spin_gain.set_value(self.stream_info["gain"])
-                    self.lbl_gain.set_label("{:2.1f}dB".format(self.stream_info["gain"]))
-
-                if self.last_xhdr == 0:
-                    image_path = os.path.join(self.aas_dir, self.stream_info["cover"])
-                    image = self.stream_info["cover"]
-                elif self.last_xhdr == 1:
-                    image_path = os.path.join(self.aas_dir, self.stream_info["logo"])
-                    image = self.stream_info["logo"]
-                    if not os.path.isfile(image_path):
-                        self.img_cover.clear()
-
-                # resize and display image if it changed and exists
-                if self.xhdr_changed and self.last_image != image and os.path.isfile(image_path):
-                    self.xhdr_changed = False
-                    self.last_image = image
-                    pixbuf = GdkPixbuf.Pixbuf.new_from_file(image_path)
-                    pixbuf = pixbuf.scale_simple(200, 200, GdkPixbuf.InterpType.HYPER)
-                    self.img_cover.set_from_pixbuf(pixbuf)
-                    logging.debug("Image changed")
-            finally:
-                Gdk.threads_leave()
+        """update status information; runs once a second on the main loop"""
+        image_path = ""
+        image = ""
+        self.update_widget(self.txt_title.set_text, "title", self.stream_info["title"])
+        self.update_widget(self.txt_artist.set_text, "artist", self.stream_info["artist"])
+        self.update_widget(self.txt_album.set_text, "album", self.stream_info["album"])
+        bitrate = f"{self.stream_info['bitrate']:3.1f} kbps"
+        self.update_widget(self.lbl_bitrate.set_label, "bitrate", bitrate)
+        self.update_widget(self.lbl_bitrate2.set_label, "bitrate2", bitrate)
+        self.update_widget(self.lbl_callsign.set_label, "callsign", " " + self.stream_info["callsign"])
+        self.update_widget(self.lbl_name.set_label, "name", self.stream_info["callsign"])
+        self.update_widget(self.lbl_slogan.set_label, "slogan", self.stream_info["slogan"])
+        self.update_widget(self.lbl_slogan.set_tooltip_text, "slogan_tooltip", self.stream_info["slogan"])
+        self.update_widget(self.lbl_mer_lower.set_label, "mer_lower",
+                           f"{self.stream_info['mer'][0]:1.2f} dB")
+        self.update_widget(self.lbl_mer_upper.set_label, "mer_upper",
+                           f"{self.stream_info['mer'][1]:1.2f} dB")
+
+        # only rescale and reformat the error figures when a reading changed
+        cur_ber = tuple(self.stream_info["ber"])
+        if cur_ber != self.last_ber:
+            self.last_ber = cur_ber
+            ber = [value * 100 for value in cur_ber]
+            self.update_widget(self.lbl_error.set_label, "error", f"{ber[1]:2.2f}% Error ")
+            self.update_widget(self.lbl_ber_now.set_label, "ber_now", f"{ber[0]:1.3f}% (Now)")
+            self.update_widget(self.lbl_ber_avg.set_label, "ber_avg", f"{ber[1]:1.3f}% (Avg)")
+            self.update_widget(self.lbl_ber_min.set_label, "ber_min", f"{ber[2]:1.3f}% (Min)")
+            self.update_widget(self.lbl_ber_max.set_label, "ber_max", f"{ber[3]:1.3f}% (Max)")
+
+        if self.cb_auto_gain.get_active():
+            self.spin_gain.set_value(self.stream_info["gain"])
+            self.update_widget(self.lbl_gain.set_label, "gain",
+                               f"{self.stream_info['gain']:2.1f}dB")
+
+        if self.last_xhdr == 0:
+            image_path = os.path.join(self.aas_dir, self.stream_info["cover"])
+            image = self.stream_info["cover"]
+        elif self.last_xhdr == 1:
+            image_path = os.path.join(self.aas_dir, self.stream_info["logo"])
+            image = self.stream_info["logo"]
+            if not os.path.isfile(image_path):
+                self.img_cover.clear()
+
+        # resize and display image if it changed and exists
+        if self.xhdr_changed and self.last_image != image and os.path.isfile(image_path):
+            self.xhdr_changed = False
+            self.last_image = image
+            self.img_cover.set_from_pixbuf(self.load_scaled_pixbuf(image_path))
+            logging.debug("Image changed")
+
+        return True  # keep the timeout running
+
+    def submit_map_task(self, func, *args):
+        """queue map processing on the worker thread with its errors logged"""
+        self.map_executor.submit(self.run_map_task, func, *args)
 
-        if self.playing:
-            GObject.idle_add(update)
-            self.status_timer = threading.Timer(1, self.check_status)
-            self.status_timer.start()
+    @staticmethod
+    def run_map_task(func, *args):
+        try:
+            func(*args)
+        except Exception:
+            logging.exception("Error processing map data")
 
     def process_traffic_map(self, filename, data):
-        regex = re.compile(r"^TMT_.*_([1-3])_([1-3])_(\d{8}_\d{4}).*$")
-        match = regex.match(filename)
+        parsed = parse_traffic_filename(filename)
+        if parsed is None:
+            # fall back to the regex for names not in the usual fixed layout
+            match = TRAFFIC_FILE_RE.match(filename)
+            if match:
+                parsed = (int(match.group(1))-1, int(match.group(2))-1, match.group(3))
 
-        if match:
-            tile_x = int(match.group(1))-1
-            tile_y = int(match.group(2))-1
-            utc_time = datetime.strptime(match.group(3), "%Y%m%d_%H%M").replace(tzinfo=timezone.utc)
+        if parsed:
+            tile_x, tile_y, time_str = parsed
+            utc_time = datetime.strptime(time_str, "%Y%m%d_%H%M").replace(tzinfo=timezone.utc)
             timestamp = int(utc_time.timestamp())
 
             # check if the tile has already been loaded
@@ -476,24 +574,34 @@ class NRSC5GUI(object):
             logging.debug("Got traffic map tile: %s, %s", tile_x, tile_y)
 
             self.map_tiles[tile_x][tile_y] = timestamp
-            self.traffic_map.paste(Image.open(io.BytesIO(data)), (tile_y*200, tile_x*200))
+
+            # stations often resend identical tiles with a new timestamp;
+            # hashing the payload is far cheaper than inflating the PNG
+            tile_hash = hash(data)
+            if self.tile_hashes[tile_x][tile_y] != tile_hash:
+                self.tile_hashes[tile_x][tile_y] = tile_hash
+                # tiles are always PNG; skip the format autodetection probe
+                tile = Image.open(io.BytesIO(data), formats=["PNG"])
+                self.traffic_map.paste(tile, (tile_y*200, tile_x*200))
 
             # check if all of the tiles are loaded
             if self.check_tiles(timestamp):
                 logging.debug("Got complete traffic map")
-                self.traffic_map.save(os.path.join("map", "traffic_map.png"))
-
-                # display on map page
-                if self.rad_map_traffic.get_active():
-                    img_map = self.traffic_map.resize((200, 200), Image.LANCZOS)
-                    self.img_map.set_from_pixbuf(img_to_pixbuf(img_map))
-
-                if self.map_viewer is not None:
-                    self.map_viewer.updated()
+                map_file = os.path.join("map", "traffic_map.png")
+                # rewritten every few minutes; fast compression beats small files here
+                self.traffic_map.save(map_file, compress_level=1)
+                thumb = self.save_thumbnail(self.traffic_map, map_file)
+
+                # widgets may only be touched from the main loop
+                def show():
+                    if self.rad_map_traffic.get_active():
+                        self.img_map.set_from_pixbuf(img_to_pixbuf(thumb))
+                    self.notify_viewer()
+                    return False
+                GLib.idle_add(show)
 
     def process_weather_overlay(self, filename, data):
-        regex = re.compile(r"^DWRO_(.*)_.*_(\d{8}_\d{4}).*$")
-        match = regex.match(filename)
+        match = WEATHER_OVERLAY_RE.match(filename)
 
         if match:
             utc_time = datetime.strptime(match.group(2), "%Y%m%d_%H%M").replace(tzinfo=timezone.utc)
@@ -518,24 +626,50 @@ class NRSC5GUI(object):
                 if not os.path.isfile(map_path):
                     self.make_base_map(self.map_data["weather_id"], self.map_data["weather_pos"])
 
-                img_map = Image.open(map_path).convert("RGBA")
+                # the base map only changes when the station changes, so decode it once
+                if self.base_map_img is None:
+                    self.base_map_img = Image.open(map_path).convert("RGBA")
+
+                # reuse one scratch image across overlays instead of allocating
+                # a full-size copy of the base map for every frame
+                if (self.weather_scratch is None
+                        or self.weather_scratch.size != self.base_map_img.size):
+                    self.weather_scratch = self.base_map_img.copy()
+                else:
+                    self.weather_scratch.paste(self.base_map_img, (0, 0))
+                img_map = self.weather_scratch
                 timestamp_pos = (img_map.size[0]-235, img_map.size[1]-29)
-                img_ts = self.make_timestamp(utc_time.astimezone(), img_map.size, timestamp_pos)
+                img_ts = self.make_timestamp(utc_time.astimezone())
                 img_radar = Image.open(io.BytesIO(data)).convert("RGBA")
                 img_radar = img_radar.resize(img_map.size, Image.LANCZOS)
-                img_map = Image.alpha_composite(img_map, img_radar)
-                img_map = Image.alpha_composite(img_map, img_ts)
-                img_map.save(weather_map_path)
+                # in-place alpha compositing blends into the copy directly,
+                # saving the extra full-size image the module-level
+                # alpha_composite would allocate
+                img_map.alpha_composite(img_radar)
+                img_map.alpha_composite(img_ts, timestamp_pos)
+                # saved once per overlay and deleted within 12 hours, so
+                # favor encode speed over size
+                img_map.save(weather_map_path, compress_level=1)
+                thumb = self.save_thumbnail(img_map, weather_map_path)
                 self.map_data["weather_now"] = weather_map_path
 
-                # display on map page
-                if self.rad_map_weather.get_active():
-                    img_map = img_map.resize((200, 200), Image.LANCZOS)
-                    self.img_map.set_from_pixbuf(img_to_pixbuf(img_map))
-
-                self.process_weather_maps()  # get rid of old maps and add new ones to the list
-                if self.map_viewer is not None:
-                    self.map_viewer.updated()
+                # register the new map directly; overlays always arrive newest
+                # last, so appending keeps the list in time order
+                if weather_map_path not in self.weather_maps:
+                    self.weather_maps.append(weather_map_path)
+
+                # a full directory rescan is only needed to expire old maps
+                if time.time() - self.last_map_prune > 60*30:
+                    self.last_map_prune = time.time()
+                    self.process_weather_maps()
+
+                # widgets may only be touched from the main loop
+                def show():
+                    if self.rad_map_weather.get_active():
+                        self.img_map.set_from_pixbuf(img_to_pixbuf(thumb))
+                    self.notify_viewer()
+                    return False
+                GLib.idle_add(show)
 
             except OSError:
                 logging.error("Error creating weather map")
@@ -546,21 +680,23 @@ class NRSC5GUI(object):
         weather_pos = None
 
         for line in data.decode().split("\n"):
-            if "DWR_Area_ID=" in line:
-                regex = re.compile("^DWR_Area_ID=\"(.+)\"$")
-                match = regex.match(line)
-                weather_id = match.group(1)
+            if line.startswith("DWR_Area_ID="):
+                # the ID is the quoted value: DWR_Area_ID="XXX"
+                parts = line.split("\"")
+                if len(parts) >= 2:
+                    weather_id = parts[1]
 
-            elif "Coordinates=" in line:
-                regex = re.compile(r"^Coordinates=.*\((.*),(.*)\).*\((.*),(.*)\).*$")
-                match = regex.match(line)
-                weather_pos = [float(match.group(i)) for i in range(1, 5)]
+            elif line.startswith("Coordinates="):
+                match = COORDINATES_RE.match(line)
+                if match:
+                    weather_pos = [float(match.group(i)) for i in range(1, 5)]
 
         if weather_id is not None and weather_pos is not None:
             if self.map_data["weather_id"] != weather_id or self.map_data["weather_pos"] != weather_pos:
                 logging.debug("Got position: (%n, %n) (%n, %n)", *weather_pos)
                 self.map_data["weather_id"] = weather_id
                 self.map_data["weather_pos"] = weather_pos
+                self.base_map_img = None  # drop the cached base map for the old area
 
                 self.make_base_map(weather_id, weather_pos)
                 self.weather_maps = []
@@ -568,46 +704,53 @@ class NRSC5GUI(object):
 
     def process_weather_maps(self):
         number_of_maps = 0
-        regex = re.compile("^map.weather_map_([a-zA-Z0-9]+)_([0-9]+).png")
         now = time.time()
-        files = glob.glob(os.path.join("map", "weather_map_") + "*.png")
-        files.sort()
-        for file in files:
-            match = regex.match(file)
-            if match:
-                map_id = match.group(1)
-                timestamp = int(match.group(2))
-
-                # remove weather maps older than 12 hours
-                if now - timestamp > 60*60*12:
-                    try:
-                        if file in self.weather_maps:
-                            self.weather_maps.pop(self.weather_maps.index(file))
-                        os.remove(file)
-                        logging.debug("Deleted old weather map: %s", file)
-                    except OSError:
-                        logging.error("Failed to delete old weather map: %s", file)
-
+        try:
+            with os.scandir("map") as entries:
+                files = [entry for entry in entries
+                         if entry.name.startswith("weather_map_") and entry.name.endswith(".png")]
+        except OSError:
+            return
+        files.sort(key=lambda entry: entry.name)
+        for entry in files:
+            match = WEATHER_MAP_RE.match(entry.name)
+            if match is None:
+                continue
+
+            # remove weather maps older than 12 hours; the filename carries
+            # the map's timestamp, so no stat call is needed
+            if now - int(match.group(2)) > 60*60*12:
+                try:
+                    if entry.path in self.weather_maps:
+                        self.weather_maps.remove(entry.path)
+                    os.remove(entry.path)
+                    thumb = self.thumbnail_path(entry.path)
+                    if os.path.isfile(thumb):
+                        os.remove(thumb)
+                    logging.debug("Deleted old weather map: %s", entry.path)
+                except OSError:
+                    logging.error("Failed to delete old weather map: %s", entry.path)
+            elif match.group(1) == self.map_data["weather_id"]:
                 # skip if not the correct location
-                elif map_id == self.map_data["weather_id"]:
-                    if file not in self.weather_maps:
-                        self.weather_maps.append(file)
-                    number_of_maps += 1
+                if entry.path not in self.weather_maps:
+                    self.weather_maps.append(entry.path)
+                number_of_maps += 1
 
         logging.debug("Found %s weather maps", number_of_maps)
 
-    @staticmethod
-    def map_image_coordinates(lat_degrees, lon_degrees):
-        """convert latitude & longitude to x & y cooordinates in the map"""
-        first_tile_x, first_tile_y = 35, 84
-        zoom_level = 8
-        tile_size = 256
+    # base map tiling parameters; must match build_map.py
+    MAP_FIRST_TILE = (35, 84)
+    MAP_ZOOM_SCALE = 2**8  # number of tiles across the world at zoom level 8
+    MAP_TILE_SIZE = 256
 
+    @classmethod
+    def map_image_coordinates(cls, lat_degrees, lon_degrees):
+        """convert latitude & longitude to x & y cooordinates in the map"""
         map_x = (1 + math.radians(lon_degrees) / math.pi) / 2
         map_y = (1 - math.asinh(math.tan(math.radians(lat_degrees))) / math.pi) / 2
-        tile_x = map_x * (2**zoom_level) - first_tile_x
-        tile_y = map_y * (2**zoom_level) - first_tile_y
-        return int(round(tile_x * tile_size)), int(round(tile_y * tile_size))
+        tile_x = map_x * cls.MAP_ZOOM_SCALE - cls.MAP_FIRST_TILE[0]
+        tile_y = map_y * cls.MAP_ZOOM_SCALE - cls.MAP_FIRST_TILE[1]
+        return int(round(tile_x * cls.MAP_TILE_SIZE)), int(round(tile_y * cls.MAP_TILE_SIZE))
 
     def make_base_map(self, map_id, pos):
         """crop the map to the area needed for weather radar"""
@@ -625,25 +768,48 @@ class NRSC5GUI(object):
             map_img = Image.new("RGBA", (pos[2]-pos[1], pos[3]-pos[1]), "white")
             map_img.save(map_path)
 
+    @staticmethod
+    def thumbnail_path(map_file):
+        """path of the 200x200 thumbnail stored alongside a map image"""
+        base, ext = os.path.splitext(map_file)
+        return base + "_thumb" + ext
+
+    @classmethod
+    def save_thumbnail(cls, img_map, map_file):
+        """save a 200x200 thumbnail next to a map image and return it"""
+        factor = min(img_map.size[0] // 200, img_map.size[1] // 200)
+        if factor > 1:
+            # integer box reduction is much cheaper than resampling the full
+            # image; for the 600x600 traffic map this alone yields 200x200
+            img_map = img_map.reduce(factor)
+        if img_map.size != (200, 200):
+            img_map = img_map.resize((200, 200), Image.BILINEAR)
+        img_map.save(cls.thumbnail_path(map_file), compress_level=1)
+        return img_map
+
     def check_tiles(self, timestamp):
         """check if all the tiles have been received"""
-        for i in range(3):
-            for j in range(3):
-                if self.map_tiles[i][j] != timestamp:
-                    return False
-        return True
+        return all(tile == timestamp for row in self.map_tiles for tile in row)
 
-    @staticmethod
-    def make_timestamp(local_time, size, pos):
+    def make_timestamp(self, local_time):
         """create a timestamp image to overlay on the weathermap"""
-        pos_x, pos_y = pos
-        text = datetime.strftime(local_time, "%Y-%m-%d %H:%M")
-        img_ts = Image.new("RGBA", size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img_ts)
-        font = ImageFont.truetype("DejaVuSansMono.ttf", 24)
-        draw.rectangle((pos_x, pos_y, pos_x+231, pos_y+25), outline="black", fill=(128, 128, 128, 96))
-        draw.text((pos_x+3, pos_y), text, fill="black", font=font)
-        return img_ts
+        if self.timestamp_font is None:
+            self.timestamp_font = ImageFont.truetype("DejaVuSansMono.ttf", 24)
+        if self.timestamp_template is None:
+            self.timestamp_template = Image.new("RGBA", (232, 26), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(self.timestamp_template)
+            draw.rectangle((0, 0, 231, 25), outline="black", fill=(128, 128, 128, 96))
+
+        text = local_time.strftime("%Y-%m-%d %H:%M")
+        if self.timestamp_text != text:
+            # the text only changes once a minute; reuse the rendered tile
+            # for every composite in between
+            img_ts = self.timestamp_template.copy()
+            draw = ImageDraw.Draw(img_ts)
+            draw.text((3, 0), text, fill="black", font=self.timestamp_font)
+            self.timestamp_text = text
+            self.timestamp_img = img_ts
+        return self.timestamp_img
 
     def audio_worker(self):
         audio = pyaudio.PyAudio()
@@ -653,34 +819,72 @@ class NRSC5GUI(object):
                                 channels=2,
                                 rate=self.AUDIO_SAMPLE_RATE,
                                 output_device_index=index,
+                                # a few frames of device buffer ride out
+                                # scheduling hiccups between writes
+                                frames_per_buffer=self.AUDIO_SAMPLES_PER_FRAME * 4,
                                 output=True)
         except OSError:
             logging.warning("No audio output device available")
             stream = None
 
         while True:
-            samples = self.audio_queue.get()
+            try:
+                samples = self.audio_buffer.popleft()
+            except IndexError:
+                # the buffer ran dry; let a few frames accumulate before
+                # resuming so one late frame doesn't underrun again at once
+                while (len(self.audio_buffer) < self.AUDIO_PREBUFFER_FRAMES
+                       and None not in self.audio_buffer):
+                    self.audio_event.wait()
+                    self.audio_event.clear()
+                continue
             if samples is None:
                 break
             if stream:
                 stream.write(samples)
-            self.audio_queue.task_done()
 
         if stream:
             stream.stop_stream()
             stream.close()
         audio.terminate()
 
-    def update_bitrate(self, bits):
-        kbps = bits * self.AUDIO_SAMPLE_RATE / self.AUDIO_SAMPLES_PER_FRAME / 1000
-        if self.stream_info["bitrate"] == 0:
+    def ensure_aas_dir(self):
+        """create the AAS directory the first time a file needs to go in it"""
+        if self.aas_dir_ok is None:
+            self.aas_dir_ok = make_dir(self.aas_dir)
+        return self.aas_dir_ok
+
+    def ensure_map_dir(self):
+        """create the map directory the first time a file needs to go in it"""
+        if self.map_dir_ok is None:
+            self.map_dir_ok = make_dir(self.map_dir)
+        return self.map_dir_ok
+
+    def file_writer_worker(self):
+        """write queued AAS files so the nrsc5 callback doesn't block on disk"""
+        while True:
+            item = self.file_writer_queue.get()
+            if item is None:
+                break
+            path, data = item
+            try:
+                write_file(path, data)
+            except OSError:
+                logging.error("Failed to write file: %s", path)
+
+    def update_bitrate(self, num_bytes):
+        kbps = num_bytes * self.bitrate_scale
+        bitrate = self.stream_info["bitrate"]
+        if bitrate == 0:
             self.stream_info["bitrate"] = kbps
         else:
-            self.stream_info["bitrate"] = 0.99 * self.stream_info["bitrate"] + 0.01 * kbps
+            self.stream_info["bitrate"] = 0.99 * bitrate + 0.01 * kbps
 
     def update_ber(self, cber):
         ber = self.stream_info["ber"]
-        if ber[0] == ber[1] == ber[2] == ber[3] == 0:
+        if not self.ber_primed:
+            # seed the averages with the first reading
+            self.ber_primed = True
             ber[0] = cber
             ber[1] = cber
             ber[2] = cber
@@ -688,98 +892,120 @@ class NRSC5GUI(object):
         else:
             ber[0] = cber
             ber[1] = 0.9 * ber[1] + 0.1 * cber
-            if cber < ber[2]:
-                ber[2] = cber
-            if cber > ber[3]:
-                ber[3] = cber
+            ber[2] = min(ber[2], cber)
+            ber[3] = max(ber[3], cber)
 
     def callback(self, evt_type, evt):
-        if evt_type == nrsc5.EventType.LOST_DEVICE:
-            pass  # TODO: update the GUI?
-        elif evt_type == nrsc5.EventType.SYNC:
-            self.stream_info["gain"] = self.radio.get_gain()
-            # TODO: update the GUI?
-        elif evt_type == nrsc5.EventType.LOST_SYNC:
-            pass  # TODO: update the GUI?
-        elif evt_type == nrsc5.EventType.MER:
-            self.stream_info["mer"] = [evt.lower, evt.upper]
-        elif evt_type == nrsc5.EventType.BER:
-            self.update_ber(evt.cber)
-        elif evt_type == nrsc5.EventType.HDC:
-            if evt.program == self.stream_num:
-                self.update_bitrate(len(evt.data) * 8)
-        elif evt_type == nrsc5.EventType.AUDIO:
-            if evt.program == self.stream_num:
-                self.audio_queue.put(evt.data)
-        elif evt_type == nrsc5.EventType.ID3:
-            if evt.program == self.stream_num:
-                if evt.title:
-                    self.stream_info["title"] = evt.title
-                if evt.artist:
-                    self.stream_info["artist"] = evt.artist
-                if evt.album:
-                    self.stream_info["album"] = evt.album
-                if evt.xhdr:
-                    if evt.xhdr.param != self.last_xhdr:
-                        self.last_xhdr = evt.xhdr.param
-                        self.xhdr_changed = True
-                        logging.debug("XHDR changed: %s", evt.xhdr.param)
-        elif evt_type == nrsc5.EventType.SIG:
-            for service in evt:
-                if service.type == nrsc5.ServiceType.AUDIO:
-                    for component in service.components:
-                        if component.type == nrsc5.ComponentType.DATA:
-                            if component.data.mime == nrsc5.MIMEType.PRIMARY_IMAGE:
-                                self.streams[service.number-1]["image"] = component.data.port
-                            elif component.data.mime == nrsc5.MIMEType.STATION_LOGO:
-                                self.streams[service.number-1]["logo"] = component.data.port
-                elif service.type == nrsc5.ServiceType.DATA:
-                    for component in service.components:
-                        if component.type == nrsc5.ComponentType.DATA:
-                            if component.data.mime == nrsc5.MIMEType.TTN_STM_TRAFFIC:
-                                self.traffic_port = component.data.port
-                            elif component.data.mime == nrsc5.MIMEType.TTN_STM_WEATHER:
-                                self.weather_port = component.data.port
-        elif evt_type == nrsc5.EventType.LOT:
-            logging.debug("LOT port=%s", evt.port)
-
-            if self.map_dir is not None:
-                if evt.port == self.traffic_port:
-                    if evt.name.startswith("TMT_"):
-                        self.process_traffic_map(evt.name, evt.data)
-                elif evt.port == self.weather_port:
-                    if evt.name.startswith("DWRO_"):
-                        self.process_weather_overlay(evt.name, evt.data)
-                    elif evt.name.startswith("DWRI_"):
-                        self.process_weather_info(evt.data)
-
-            if self.aas_dir is not None:
+        """handle an event from the radio; runs on the nrsc5 thread"""
+        handler = self.event_handlers.get(evt_type)
+        if handler is not None:
+            handler(evt)
+
+    def handle_sync(self, _evt):
+        self.stream_info["gain"] = self.radio.get_gain()
+        # TODO: update the GUI?
+
+    def handle_mer(self, evt):
+        self.stream_info["mer"] = [evt.lower, evt.upper]
+
+    def handle_ber(self, evt):
+        self.update_ber(evt.cber)
+
+    def handle_hdc(self, evt):
+        if evt.program == self.stream_num:
+            self.update_bitrate(len(evt.data))
+
+    def handle_audio(self, evt):
+        if evt.program == self.stream_num:
+            self.audio_buffer.append(evt.data)
+            self.audio_event.set()
+
+    def handle_id3(self, evt):
+        if evt.program == self.stream_num:
+            if evt.title:
+                self.stream_info["title"] = evt.title
+            if evt.artist:
+                self.stream_info["artist"] = evt.artist
+            if evt.album:
+                self.stream_info["album"] = evt.album
+            if evt.xhdr:
+                if evt.xhdr.param != self.last_xhdr:
+                    self.last_xhdr = evt.xhdr.param
+                    self.xhdr_changed = True
+                    logging.debug("XHDR changed: %s", evt.xhdr.param)
+
+    def handle_sig(self, evt):
+        for service in evt:
+            if service.type == nrsc5.ServiceType.AUDIO:
+                for component in service.components:
+                    if component.type == nrsc5.ComponentType.DATA:
+                        if component.data.mime == nrsc5.MIMEType.PRIMARY_IMAGE:
+                            self.streams[service.number-1]["image"] = component.data.port
+                            self.port_to_stream[component.data.port] = (service.number-1, "cover")
+                            self.active_ports.add(component.data.port)
+                        elif component.data.mime == nrsc5.MIMEType.STATION_LOGO:
+                            self.streams[service.number-1]["logo"] = component.data.port
+                            self.port_to_stream[component.data.port] = (service.number-1, "logo")
+                            self.active_ports.add(component.data.port)
+            elif service.type == nrsc5.ServiceType.DATA:
+                for component in service.components:
+                    if component.type == nrsc5.ComponentType.DATA:
+                        if component.data.mime == nrsc5.MIMEType.TTN_STM_TRAFFIC:
+                            self.traffic_port = component.data.port
+                            self.active_ports.add(component.data.port)
+                        elif component.data.mime == nrsc5.MIMEType.TTN_STM_WEATHER:
+                            self.weather_port = component.data.port
+                            self.active_ports.add(component.data.port)
+
+    def handle_lot(self, evt):
+        if evt.port not in self.active_ports:
+            return  # not a port this GUI tracks
+        logging.debug("LOT port=%s", evt.port)
+
+        if evt.port == self.traffic_port:
+            if evt.name.startswith("TMT_") and self.ensure_map_dir():
+                self.submit_map_task(self.process_traffic_map, evt.name, evt.data)
+        elif evt.port == self.weather_port:
+            if self.ensure_map_dir():
+                if evt.name.startswith("DWRO_"):
+                    self.submit_map_task(self.process_weather_overlay, evt.name, evt.data)
+                elif evt.name.startswith("DWRI_"):
+                    self.submit_map_task(self.process_weather_info, evt.data)
+        else:
+            entry = self.port_to_stream.get(evt.port)
+            if entry is not None and self.ensure_aas_dir():
                 path = os.path.join(self.aas_dir, evt.name)
-                for i, stream in enumerate(self.streams):
-                    if evt.port == stream.get("image"):
-                        logging.debug("Got album cover: %s", evt.name)
-                        with open(path, "wb") as file:
-                            file.write(evt.data)
-                        if i == self.stream_num:
-                            self.stream_info["cover"] = evt.name
-                    elif evt.port == stream.get("logo"):
-                        logging.debug("Got station logo: %s", evt.name)
-                        with open(path, "wb") as file:
-                            file.write(evt.data)
+                i, kind = entry
+
+                # stations rebroadcast identical covers/logos; skip duplicate writes
+                data = evt.data if isinstance(evt.data, bytes) else bytes(evt.data)
+                file_hash = hash(data)
+                if self.lot_hashes.get(evt.name) != file_hash:
+                    self.lot_hashes[evt.name] = file_hash
+                    self.file_writer_queue.put((path, data))
+                    self.pixbuf_cache.pop(path, None)  # file is being replaced
+
+                if kind == "cover":
+                    logging.debug("Got album cover: %s", evt.name)
+                    if i == self.stream_num:
+                        self.stream_info["cover"] = evt.name
+                elif kind == "logo":
+                    logging.debug("Got station logo: %s", evt.name)
+                    if self.station_logos[self.station_str][i] != evt.name:
                         self.station_logos[self.station_str][i] = evt.name
-                        if i == self.stream_num:
-                            self.stream_info["logo"] = evt.name
+                        self.station_logos_dirty = True
+                    if i == self.stream_num:
+                        self.stream_info["logo"] = evt.name
 
-        elif evt_type == nrsc5.EventType.SIS:
-            if evt.name:
-                self.stream_info["callsign"] = evt.name
-            if evt.slogan:
-                self.stream_info["slogan"] = evt.slogan
+    def handle_sis(self, evt):
+        if evt.name:
+            self.stream_info["callsign"] = evt.name
+        if evt.slogan:
+            self.stream_info["slogan"] = evt.slogan
 
     def get_controls(self):
         # setup gui
-        builder = Gtk.Builder()
-        builder.add_from_file("main_form.glade")
+        builder = load_glade_builder("main_form.glade")
         builder.connect_signals(self)
 
         # Windows
@@ -789,38 +1015,8 @@ class NRSC5GUI(object):
         self.about_dialog = None
 
         # get controls
-        self.notebook_main = builder.get_object("notebook_main")
-        self.img_cover = builder.get_object("img_cover")
-        self.img_map = builder.get_object("img_map")
-        self.spin_freq = builder.get_object("spin_freq")
-        self.spin_stream = builder.get_object("spin_stream")
-        self.spin_gain = builder.get_object("spin_gain")
-        self.spin_ppm = builder.get_object("spin_ppm")
-        self.spin_rtl = builder.get_object("spin_rtl")
-        self.cb_auto_gain = builder.get_object("cb_auto_gain")
-        self.btn_play = builder.get_object("btn_play")
-        self.btn_stop = builder.get_object("btn_stop")
-        self.btn_bookmark = builder.get_object("btn_bookmark")
-        self.btn_delete = builder.get_object("btn_delete")
-        self.rad_map_traffic = builder.get_object("rad_map_traffic")
-        self.rad_map_weather = builder.get_object("rad_map_weather")
-        self.txt_title = builder.get_object("txt_title")
-        self.txt_artist = builder.get_object("txt_artist")
-        self.txt_album = builder.get_object("txt_album")
-        self.lbl_name = builder.get_object("lbl_name")
-        self.lbl_slogan = builder.get_object("lbl_slogan")
-        self.lbl_callsign = builder.get_object("lbl_callsign")
-        self.lbl_gain = builder.get_object("lbl_gain")
-        self.lbl_bitrate = builder.get_object("lbl_bitrate")
-        self.lbl_bitrate2 = builder.get_object("lbl_bitrate2")
-        self.lbl_error = builder.get_object("lbl_error")
-        self.lbl_mer_lower = builder.get_object("lbl_mer_lower")
-        self.lbl_mer_upper = builder.get_object("lbl_mer_upper")
-        self.lbl_ber_now = builder.get_object("lbl_ber_now")
-        self.lbl_ber_avg = builder.get_object("lbl_ber_avg")
-        self.lbl_ber_min = builder.get_object("lbl_ber_min")
-        self.lbl_ber_max = builder.get_object("lbl_ber_max")
-        self.lv_bookmarks = builder.get_object("lv_bookmarks")
+        for name in _CONTROL_NAMES:
+            setattr(self, name, builder.get_object(name))
         self.ls_bookmarks = Gtk.ListStore(str, str, int)
 
         self.lv_bookmarks.set_model(self.ls_bookmarks)
@@ -842,10 +1038,20 @@ class NRSC5GUI(object):
         }
 
         self.streams = [{}, {}, {}, {}]
+        self.port_to_stream = {}  # maps a LOT port to (stream number, "cover"|"logo")
+        self.lot_hashes = {}  # hash of the last payload written for each LOT name
+        self.active_ports = set()  # every LOT port worth processing
         self.traffic_port = -1
         self.weather_port = -1
+        self.label_cache = {}  # last text written to each status widget
+        self.last_ber = None  # BER readings behind the currently shown figures
+        self.ber_primed = False  # the averages hold at least one real reading
+
+        # both callers run on the GTK thread, so clear synchronously; a
+        # deferred clear would land after play has set the station logo
+        self.clear_status_widgets()
 
-        # clear status info
+    def clear_status_widgets(self):
         self.lbl_callsign.set_label("")
         self.lbl_bitrate.set_label("")
         self.lbl_bitrate2.set_label("")
@@ -867,70 +1073,64 @@ class NRSC5GUI(object):
 
     def load_settings(self):
         try:
-            with open("station_logos.json", mode="r") as file:
-                self.station_logos = json.load(file)
-        except (OSError, json.decoder.JSONDecodeError):
+            self.station_logos = load_json("station_logos.json")
+        except (OSError, ValueError):
             logging.warning("Unable to load station logo database")
 
         # load settings
         try:
-            with open("config.json", mode="r") as file:
-                config = json.load(file)
-
-                if "map_data" in config:
-                    self.map_data = config["map_data"]
-                    if self.map_data["map_mode"] == 0:
-                        self.rad_map_traffic.set_active(True)
-                        self.rad_map_traffic.toggled()
-                    elif self.map_data["map_mode"] == 1:
-                        self.rad_map_weather.set_active(True)
-                        self.rad_map_weather.toggled()
-
-                if "width" and "height" in config:
-                    self.main_window.resize(config["width"], config["height"])
-
-                self.main_window.move(config["window_x"], config["window_y"])
-                self.spin_freq.set_value(config["frequency"])
-                self.spin_stream.set_value(config["stream"])
-                self.spin_gain.set_value(config["gain"])
-                self.cb_auto_gain.set_active(config["auto_gain"])
-                self.spin_ppm.set_value(config["ppm_error"])
-                self.spin_rtl.set_value(config["rtl"])
-                self.bookmarks = config["bookmarks"]
-                for bookmark in self.bookmarks:
-                    self.ls_bookmarks.append(bookmark)
-        except (OSError, json.decoder.JSONDecodeError, KeyError):
+            config = load_json("config.json")
+
+            if "map_data" in config:
+                self.map_data = config["map_data"]
+                if self.map_data["map_mode"] == 0:
+                    self.rad_map_traffic.set_active(True)
+                    self.rad_map_traffic.toggled()
+                elif self.map_data["map_mode"] == 1:
+                    self.rad_map_weather.set_active(True)
+                    self.rad_map_weather.toggled()
+
+            if "width" in config and "height" in config:
+                self.main_window.resize(config["width"], config["height"])
+
+            self.main_window.move(config["window_x"], config["window_y"])
+            self.spin_freq.set_value(config["frequency"])
+            self.spin_stream.set_value(config["stream"])
+            self.spin_gain.set_value(config["gain"])
+            self.cb_auto_gain.set_active(config["auto_gain"])
+            self.spin_ppm.set_value(config["ppm_error"])
+            self.spin_rtl.set_value(config["rtl"])
+            self.bookmarks = config["bookmarks"]
+            # detach the model during the bulk insert so the view lays out
+            # once at the end instead of after every row
+            self.lv_bookmarks.set_model(None)
+            for bookmark in self.bookmarks:
+                self.bookmark_by_freq[bookmark[2]] = bookmark
+                self.ls_bookmarks.insert_with_valuesv(-1, [0, 1, 2], bookmark)
+            self.lv_bookmarks.set_model(self.ls_bookmarks)
+        except (OSError, ValueError, KeyError):
             logging.warning("Unable to load config")
 
-        # create aas directory
+        # the aas and map directories are created lazily on first use
         self.aas_dir = os.path.join(sys.path[0], "aas")
-        if not os.path.isdir(self.aas_dir):
-            try:
-                os.mkdir(self.aas_dir)
-            except OSError:
-                logging.error("Unable to create AAS directory")
-                self.aas_dir = None
-
-        # create map directory
+        self.aas_dir_ok = None
         self.map_dir = os.path.join(sys.path[0], "map")
-        if not os.path.isdir(self.map_dir):
-            try:
-                os.mkdir(self.map_dir)
-            except OSError:
-                logging.error("Unable to create map directory")
-                self.map_dir = None
+        self.map_dir_ok = None
+
+        # pre-decode known station logos so tuning a station is just a cache hit
+        for logos in self.station_logos.values():
+            for name in logos:
+                logo_path = os.path.join(self.aas_dir, name)
+                if name and os.path.isfile(logo_path):
+                    try:
+                        self.load_scaled_pixbuf(logo_path)
+                    except GLib.Error:
+                        logging.warning("Unable to load logo: %s", logo_path)
 
     def shutdown(self, *_args):
         # stop map viewer animation if it's running
-        if self.map_viewer is not None and self.map_viewer.animate_timer is not None:
-            self.map_viewer.animate_timer.cancel()
-            self.map_viewer.animate_stop = True
-
-            while self.map_viewer.animate_busy:
-                logging.debug("Animation busy - stopping")
-                if self.map_viewer.animate_timer is not None:
-                    self.map_viewer.animate_timer.cancel()
-                time.sleep(0.25)
+        if self.map_viewer is not None:
+            self.map_viewer.stop_animation()
 
         self.playing = False
 
@@ -942,57 +1142,63 @@ class NRSC5GUI(object):
 
         # shut down status timer if it's running
         if self.status_timer is not None:
-            self.status_timer.cancel()
+            GLib.source_remove(self.status_timer)
+            self.status_timer = None
+
+        self.map_executor.shutdown()  # wait for any map still being composited
 
-        self.audio_queue.put(None)
+        self.audio_buffer.append(None)
+        self.audio_event.set()
         self.audio_thread.join()
 
+        self.file_writer_queue.put(None)
+        self.file_writer_thread.join()
+
         # save settings
         try:
-            with open("config.json", mode="w") as file:
-                window_x, window_y = self.main_window.get_position()
-                width, height = self.main_window.get_size()
-                config = {
-                    "config_version": self.VERSION,
-                    "window_x": window_x,
-                    "window_y": window_y,
-                    "width": width,
-                    "height": height,
-                    "frequency": self.spin_freq.get_value(),
-                    "stream": int(self.spin_stream.get_value()),
-                    "gain": self.spin_gain.get_value(),
-                    "auto_gain": self.cb_auto_gain.get_active(),
-                    "ppm_error": int(self.spin_ppm.get_value()),
-                    "rtl": int(self.spin_rtl.get_value()),
-                    "bookmarks": self.bookmarks,
-                    "map_data": self.map_data,
-                }
-                # sort bookmarks
-                config["bookmarks"].sort(key=lambda t: t[2])
-
-                json.dump(config, file, indent=2)
-
-            with open("station_logos.json", mode="w") as file:
-                json.dump(self.station_logos, file, indent=2)
+            window_x, window_y = self.main_window.get_position()
+            width, height = self.main_window.get_size()
+            self.bookmarks.sort(key=lambda t: t[2])
+            config = {
+                "config_version": self.VERSION,
+                "window_x": window_x,
+                "window_y": window_y,
+                "width": width,
+                "height": height,
+                "frequency": self.spin_freq.get_value(),
+                "stream": int(self.spin_stream.get_value()),
+                "gain": self.spin_gain.get_value(),
+                "auto_gain": self.cb_auto_gain.get_active(),
+                "ppm_error": int(self.spin_ppm.get_value()),
+                "rtl": int(self.spin_rtl.get_value()),
+                "bookmarks": self.bookmarks,
+                "map_data": self.map_data,
+            }
+            save_json("config.json", config)
+
+            # only rewrite the logo database if a new logo arrived this session
+            if self.station_logos_dirty:
+                save_json("station_logos.json", self.station_logos)
         except OSError:
             logging.error("Unable to save config")
 
 
 class NRSC5Map(object):
+    FRAME_CACHE_SIZE = 32
+
     def __init__(self, parent, callback, data):
         # setup gui
-        builder = Gtk.Builder()
-        builder.add_from_file("map_form.glade")
+        builder = load_glade_builder("map_form.glade")
         builder.connect_signals(self)
 
         self.parent = parent
         self.callback = callback
         self.data = data  # map data
-        self.animate_timer = None
-        self.animate_busy = False
-        self.animate_stop = False
+        self.animate_source = None  # GLib source id of the animation timer
         self.weather_maps = parent.weather_maps  # list of weather maps sorted by time
         self.map_index = 0  # the index of the next weather map to display
+        self.frame_cache = {}  # decoded frame pixbufs keyed by (filename, scale)
+        self.last_shown = None  # (filename, scale, mtime) currently displayed
 
         # get the controls
         self.map_window = builder.get_object("map_window")
@@ -1026,11 +1232,7 @@ class NRSC5Map(object):
                 self.config["mode"] = 0
                 self.img_key.set_visible(False)
 
-                # stop animation if it's enabled
-                if self.animate_timer is not None:
-                    self.animate_timer.cancel()
-                    self.animate_timer = None
-
+                self.stop_animation()
                 self.set_map(0)  # show the traffic map
 
             elif btn == self.rad_map_weather:
@@ -1038,26 +1240,20 @@ class NRSC5Map(object):
                 self.img_key.set_visible(True)  # show the key for the weather radar
 
                 # check if animate is enabled and start animation
-                if self.config["animate"] and self.animate_timer is None:
-                    self.animate_timer = threading.Timer(0.05, self.animate)
-                    self.animate_timer.start()
+                if self.config["animate"]:
+                    self.start_animation()
 
                 # no animation, just show the current map
-                elif not self.config["animate"]:
+                else:
                     self.set_map(1)
 
     def on_chk_animate_toggled(self, _btn):
         self.config["animate"] = self.chk_animate.get_active()
 
         if self.config["animate"] and self.config["mode"] == 1:
-            # start animation
-            self.animate_timer = threading.Timer(self.config["animation_speed"], self.animate)
-            self.animate_timer.start()
+            self.start_animation(int(self.config["animation_speed"] * 1000))
         else:
-            # stop animation
-            if self.animate_timer is not None:
-                self.animate_timer.cancel()
-                self.animate_timer = None
+            self.stop_animation()
             self.map_index = len(self.weather_maps)-1  # reset the animation index
             self.set_map(self.config["mode"])  # show the most recent map
 
@@ -1074,52 +1270,82 @@ class NRSC5Map(object):
         self.config["animation_speed"] = self.adj_speed.get_value()
 
     def on_map_window_delete(self, *_args):
-        # cancel the timer if it's running
-        if self.animate_timer is not None:
-            self.animate_timer.cancel()
-            self.animate_stop = True
-
-        # wait for animation to finish
-        while self.animate_busy:
-            self.parent.debugLog("Waiting for animation to finish")
-            if self.animate_timer is not None:
-                self.animate_timer.cancel()
-            time.sleep(0.25)
-
-        self.config["window_pos"] = self.map_window.get_position()
-        self.config["window_size"] = self.map_window.get_size()
+        self.stop_animation()
+
+        window_x, window_y = self.map_window.get_position()
+        width, height = self.map_window.get_size()
+        self.config["window_pos"] = (window_x, window_y)
+        self.config["window_size"] = (width, height)
         self.callback()
 
+    def start_animation(self, delay=50):
+        """start the animation timer if it isn't already running"""
+        if self.animate_source is None:
+            self.animate_source = GLib.timeout_add(delay, self.animate)
+
+    def stop_animation(self):
+        """stop the animation timer if it's running"""
+        if self.animate_source is not None:
+            GLib.source_remove(self.animate_source)
+            self.animate_source = None
+
     def animate(self):
+        """display the next weather frame; runs on the GTK main loop"""
         filename = self.weather_maps[self.map_index] if self.weather_maps else ""
         if os.path.isfile(filename):
-            self.animate_busy = True
-
-            if self.config["scale"]:
-                map_img = img_to_pixbuf(Image.open(filename).resize((600, 600), Image.LANCZOS))
-            else:
-                map_img = img_to_pixbuf(Image.open(filename))
-
-            if self.config["animate"] and self.config["mode"] == 1 and not self.animate_stop:
-                self.img_map.set_from_pixbuf(map_img)
-                self.map_index += 1
-                if self.map_index >= len(self.weather_maps):
-                    self.map_index = 0
-                    self.animate_timer = threading.Timer(2, self.animate)  # show the last image for a longer time
-                else:
-                    self.animate_timer = threading.Timer(self.config["animation_speed"], self.animate)
-
-                self.animate_timer.start()
+            # bilinear is indistinguishable at 1 fps and several times cheaper;
+            # the static view still renders its frame with lanczos
+            self.img_map.set_from_pixbuf(
+                self.get_frame_pixbuf(filename, self.config["scale"], Image.BILINEAR))
+            self.last_shown = None  # the static view no longer matches the display
+            self.map_index += 1
+            if self.map_index >= len(self.weather_maps):
+                self.map_index = 0
+                delay = 2000  # show the last image for a longer time
             else:
-                self.animate_timer = None
+                delay = int(self.config["animation_speed"] * 1000)
 
-            self.animate_busy = False
+            self.animate_source = GLib.timeout_add(delay, self.animate)
         else:
+            self.animate_source = None
             self.chk_animate.set_active(False)  # stop animation if image was not found
             self.map_index = 0
+        return False  # a new source is armed above; don't repeat this one
+
+    def get_frame_pixbuf(self, filename, scale, resample=Image.LANCZOS):
+        """load a weather frame, reusing decoded pixbufs between animation loops"""
+        # drop cached frames for maps that are no longer in the list
+        current = set(self.weather_maps)
+        for key in [key for key in self.frame_cache if key[0] not in current]:
+            del self.frame_cache[key]
+
+        key = (filename, scale, resample)
+        pixbuf = self.frame_cache.get(key)
+        if pixbuf is None:
+            img = Image.open(filename)
+            if scale:
+                img = img.resize((600, 600), resample)
+            pixbuf = img_to_pixbuf(img)
+            if len(self.frame_cache) >= self.FRAME_CACHE_SIZE:
+                # drop the oldest entry to keep memory use bounded
+                self.frame_cache.pop(next(iter(self.frame_cache)))
+            self.frame_cache[key] = pixbuf
+        return pixbuf
 
     def show_image(self, filename, scale):
         if os.path.isfile(filename):
+            # don't re-upload a pixbuf when the same file is already displayed
+            shown = (filename, scale, os.path.getmtime(filename))
+            if shown == self.last_shown:
+                return
+            self.last_shown = shown
+
+            if filename in self.weather_maps:
+                # weather frames never change once written, so the static view
+                # can share the animation's decoded pixbufs
+                self.img_map.set_from_pixbuf(self.get_frame_pixbuf(filename, scale))
+                return
+
             if scale:
                 map_img = Image.open(filename).resize((600, 600), Image.LANCZOS)
             else:
@@ -1127,6 +1353,7 @@ class NRSC5Map(object):
 
             self.img_map.set_from_pixbuf(img_to_pixbuf(map_img))
         else:
+            self.last_shown = None
             self.img_map.set_from_stock(Gtk.STOCK_MISSING_IMAGE, Gtk.IconSize.LARGE_TOOLBAR)
 
     def set_map(self, map_type):
@@ -1143,6 +1370,101 @@ class NRSC5Map(object):
             self.map_index = len(self.weather_maps)-1
 
 
+def make_dir(path):
+    """create a directory if it doesn't exist; returns False on failure"""
+    if os.path.isdir(path):
+        return True
+    try:
+        os.mkdir(path)
+        return True
+    except OSError:
+        logging.error("Unable to create directory: %s", path)
+        return False
+
+
+def write_file(path, data):
+    """write bytes straight through an fd, skipping the buffered I/O layer"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def load_json(path):
+    """parse a JSON file, using orjson when it's available"""
+    with open(path, mode="rb") as file:
+        data = file.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def save_json(path, data):
+    """write a JSON file atomically via a temporary file and os.replace"""
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, mode="wb") as file:
+            if orjson is not None:
+                file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                file.write(json.dumps(data, indent=2).encode())
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# widgets pulled from main_form.glade into NRSC5GUI attributes of the same name
+_CONTROL_NAMES = (
+    "notebook_main", "img_cover", "img_map",
+    "spin_freq", "spin_stream", "spin_gain", "spin_ppm", "spin_rtl",
+    "cb_auto_gain", "btn_play", "btn_stop", "btn_bookmark", "btn_delete",
+    "rad_map_traffic", "rad_map_weather",
+    "txt_title", "txt_artist", "txt_album",
+    "lbl_name", "lbl_slogan", "lbl_callsign", "lbl_gain",
+    "lbl_bitrate", "lbl_bitrate2", "lbl_error",
+    "lbl_mer_lower", "lbl_mer_upper",
+    "lbl_ber_now", "lbl_ber_avg", "lbl_ber_min", "lbl_ber_max",
+    "lv_bookmarks",
+)
+
+_GLADE_CACHE = {}
+
+
+def load_glade_builder(filename):
+    """create a Gtk.Builder from a glade file, caching the XML between uses"""
+    xml = _GLADE_CACHE.get(filename)
+    if xml is None:
+        with open(filename, mode="r") as file:
+            xml = file.read()
+        _GLADE_CACHE[filename] = xml
+    builder = Gtk.Builder()
+    builder.add_from_string(xml)
+    return builder
+
+
+def parse_traffic_filename(filename):
+    """parse a TMT_*_x_y_YYYYMMDD_HHMM_* traffic tile name without a regex
+
+    Returns (tile_x, tile_y, "YYYYMMDD_HHMM"), or None when the name does
+    not use the usual fixed layout and the regex fallback is needed.
+    """
+    if not filename.startswith("TMT_"):
+        return None
+    parts = filename.split("_")
+    if len(parts) < 7:
+        return None
+    tile_x, tile_y, date, hhmm = parts[-5], parts[-4], parts[-3], parts[-2]
+    if tile_x in ("1", "2", "3") and tile_y in ("1", "2", "3") \
+            and len(date) == 8 and date.isdigit() and len(hhmm) == 4 and hhmm.isdigit():
+        return int(tile_x)-1, int(tile_y)-1, date + "_" + hhmm
+    return None
+
+
 def img_to_pixbuf(img):
     """convert PIL.Image to GdkPixbuf.Pixbuf"""
     data = GLib.Bytes.new(img.tobytes())